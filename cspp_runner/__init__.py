@@ -39,6 +39,8 @@ LOG = logging.getLogger(__name__)
 _RE_NPP_STAMP = re.compile(
     r'.*?(([A-Za-z0-9]+)_d(\d+)_t(\d+)_e(\d+)_b(\d+)).*')
 
+_RE_SDR_TIMES = re.compile(r'_d(\d{8})_t(\d{7})_e(\d{7})')
+
 
 class NPPStamp(object):
 
@@ -76,15 +78,24 @@ def get_npp_stamp(filename):
 
 
 def _dte2time(date, start_time, end_time):
-    start_time = (datetime.strptime(date + start_time[:6], '%Y%m%d%H%M%S') +
-                  timedelta(microseconds=int(start_time[6]) * 100000))
-    end_time = (datetime.strptime(date + end_time[:6], '%Y%m%d%H%M%S') +
-                timedelta(microseconds=int(end_time[6]) * 100000))
+    start_time = _stamp2time(date, start_time)
+    end_time = _stamp2time(date, end_time)
     if start_time > end_time:
         end_time += timedelta(days=1)
     return start_time, end_time
 
 
+def _stamp2time(date, hhmmsst):
+    """Convert a date (yyyymmdd) and time (hhmmss + tenths) stamp to datetime.
+
+    The fixed-width fields are sliced directly, which is much cheaper than
+    going through `datetime.strptime`.
+    """
+    return datetime(int(date[:4]), int(date[4:6]), int(date[6:8]),
+                    int(hhmmsst[:2]), int(hhmmsst[2:4]), int(hhmmsst[4:6]),
+                    int(hhmmsst[6]) * 100000)
+
+
 def get_datetime_from_filename(filename):
     """Get start observation time from the filename.
 
@@ -97,14 +108,11 @@ def get_datetime_from_filename(filename):
 
 def get_sdr_times(filename):
     """Get the start and end times from the SDR file name."""
-    basename = os.path.basename(filename)
-    sll = basename.split('_')
-    start_time = datetime.strptime(sll[2] + sll[3], "d%Y%m%dt%H%M%S%f")
-    end_time = datetime.strptime(sll[2] + sll[4], "d%Y%m%de%H%M%S%f")
-    if end_time < start_time:
-        end_time += timedelta(days=1)
+    match = _RE_SDR_TIMES.search(os.path.basename(filename))
+    if not match:
+        raise ValueError("No start and end times in file name: " + str(filename))
 
-    return start_time, end_time
+    return _dte2time(*match.groups())
 
 
 def is_same_granule(filename1, filename2, sec_tolerance):
@@ -7,10 +7,14 @@ import stat
 from datetime import datetime
 import shutil
 from glob import glob
+from multiprocessing.pool import ThreadPool
 from cspp_runner.orbitno import TBUS_STYLE
 import logging
 LOG = logging.getLogger(__name__)
 
+#: Maximum number of threads used to copy SDR files to their destination
+MAX_COPY_THREADS = 8
+
 TLE_SATNAME = {'npp': 'SUOMI NPP',
                'j01': 'NOAA-20',
                'noaa20': 'NOAA-20',
@@ -114,32 +118,38 @@ def make_okay_files(base_dir, subdir_name):
     return
 
 
+def _copy_sdr_file(sdrfile, newfilename):
+    """Copy one SDR file to its destination, logging the modification times.
+
+    A single line is logged per file, so that the lines of concurrent copies
+    do not interleave.
+    """
+    src_mtime = datetime.utcfromtimestamp(os.stat(sdrfile)[stat.ST_MTIME])
+    shutil.copy(sdrfile, newfilename)
+    dst_mtime = datetime.utcfromtimestamp(os.stat(newfilename)[stat.ST_MTIME])
+    LOG.info("Copied sdrfile {src} <> ST_MTIME={src_time} to {dst} <> ST_MTIME={dst_time}".format(
+        src=str(sdrfile), src_time=src_mtime.strftime('%Y%m%d-%H%M%S'),
+        dst=str(newfilename), dst_time=dst_mtime.strftime('%Y%m%d-%H%M%S')))
+
+
 def pack_sdr_files(sdrfiles, base_dir, subdir):
     """Copy the SDR files to the sub-directory under the *subdir* directory
-    structure"""
+    structure
+
+    The copies are done concurrently in a small thread pool, as they are I/O
+    bound.  The returned list of new filenames follows the order of *sdrfiles*.
+    """
 
     path = pathlib.Path(base_dir) / subdir
     path.mkdir(exist_ok=True, parents=True)
 
     LOG.info("Number of SDR files: " + str(len(sdrfiles)))
-    retvl = []
-    for sdrfile in sdrfiles:
-        newfilename = path / os.path.basename(sdrfile)
-        LOG.info(f"Copy sdrfile to destination: {newfilename!s}")
-        if os.path.exists(sdrfile):
-            LOG.info("File to copy: {file} <> ST_MTIME={time}".format(
-                file=str(sdrfile),
-                time=datetime.utcfromtimestamp(
-                    os.stat(sdrfile)[stat.ST_MTIME]).strftime('%Y%m%d-%H%M%S')))
-        shutil.copy(sdrfile, newfilename)
-        if os.path.exists(newfilename):
-            LOG.info("File at destination: {file} <> ST_MTIME={time}".format(
-                file=str(newfilename),
-                time=datetime.utcfromtimestamp(os.stat(newfilename)[stat.ST_MTIME]).strftime('%Y%m%d-%H%M%S')))
-
-        retvl.append(os.fspath(newfilename))
-
-    return retvl
+    plans = [(sdrfile, path / os.path.basename(sdrfile)) for sdrfile in sdrfiles]
+    if plans:
+        with ThreadPool(min(MAX_COPY_THREADS, len(plans))) as pool:
+            pool.starmap(_copy_sdr_file, plans)
+
+    return [os.fspath(newfilename) for _, newfilename in plans]
 
 
 # --------------------------------
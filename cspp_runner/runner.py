@@ -74,7 +74,7 @@ LOG = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 def check_lut_files(thr_days, url_download_trial_frequency_hours,
-                    lut_update_stampfile_prefix, lut_dir):
+                    lut_update_stampfile_prefix, lut_dir, now=None):
     """Check if LUT files are present and fresh.
 
     Check if the LUT files under ${path_to_cspp_cersion}/anc/cache/luts are
@@ -90,8 +90,12 @@ def check_lut_files(thr_days, url_download_trial_frequency_hours,
     checking is a bit difficult. We check if there are any files at all, and then
     how old the latest file is, and hope that this is sufficient.
 
+    The current time (UTC) can be passed as *now*, defaulting to the actual
+    current time.
+
     """  # noqa
-    now = datetime.utcnow()
+    if now is None:
+        now = datetime.utcnow()
 
     tdelta = timedelta(
         seconds=float(url_download_trial_frequency_hours) * 3600.)
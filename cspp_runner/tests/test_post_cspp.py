@@ -34,6 +34,29 @@ def test_pack_sdr_files(tmp_path, caplog):
             os.fspath(dest),
             "subdir")
     assert "Number of SDR files: 1" in caplog.text
+    (copied,) = [rec.getMessage() for rec in caplog.records
+                 if rec.getMessage().startswith("Copied sdrfile")]
+    assert os.fspath(p) in copied
+    assert os.fspath(dest / "subdir" / "sdr.h5") in copied
     assert (dest / "subdir" / "sdr.h5").exists()
     assert len(newnames) == 1
     assert isinstance(newnames[0], str)
+
+
+def test_pack_sdr_files_keeps_order(tmp_path):
+    from cspp_runner.post_cspp import pack_sdr_files
+
+    src = tmp_path / "source"
+    src.mkdir()
+    sources = []
+    for i in range(20):
+        p = src / f"sdr{i:02d}.h5"
+        p.write_text(str(i))
+        sources.append(p)
+    dest = tmp_path / "dest"
+
+    newnames = pack_sdr_files(sources, os.fspath(dest), "subdir")
+    assert newnames == [os.fspath(dest / "subdir" / p.name) for p in sources]
+    for i, newname in enumerate(newnames):
+        with open(newname) as fp:
+            assert fp.read() == str(i)
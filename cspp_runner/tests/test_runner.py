@@ -16,90 +16,106 @@
 """Tests for runner module."""
 
 import datetime
+import io
+import itertools
 import logging
 import os
-import signal
+import subprocess
+import types
 import unittest.mock
 
 import posttroll.message
 import pytest
 
+from cspp_runner import runner as cspp_runner_runner
 
-@pytest.fixture
-def fakefile(tmp_path):
+
+def _touch(path):
+    """Create an empty file, without the extra utime call of Path.touch."""
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o644))
+
+
+@pytest.fixture(scope="session")
+def fakefile(tmp_path_factory):
     """Create a fake empty viirs granule and return its path."""
-    p = (tmp_path /
+    p = (tmp_path_factory.mktemp("rdr") /
          "RNSCA-RVIRS_npp_d20211217_t0959003_"
          "e1011484_b00001_c20211217101206466000_all-_dev.h5")
     p.touch()
     return p
 
 
-@pytest.fixture
+_FAKE_MESSAGE_DATA = {
+    "path": "",
+    "start_time": datetime.datetime(2021, 12, 17, 9, 59, 0, 300000),
+    "end_time": datetime.datetime(2021, 12, 17, 10, 11, 48, 400000),
+    "orbit_number": 1,
+    "processing_time": datetime.datetime(2021, 12, 17, 10, 12, 6, 466000),
+    "uid": "RNSCA-RVIRS_npp_d20211217_t0959003_e1011484_b00001_"
+           "c20211217101206466000_all-_dev.h5",
+    "sensor": ["viirs"],
+    "platform_name": "Suomi-NPP"}
+
+
+@pytest.fixture(scope="session")
 def fakemessage(fakefile):
+    """Return a fake posttroll message for the fake viirs granule.
+
+    The message is shared by all tests of the session, so tests must not
+    modify it; copy its data first if needed.
+    """
     return posttroll.message.Message(
-            rawstr="pytroll://file/snpp/viirs/direktempfang file "
-            "pytroll@oflks333.dwd.de 2021-12-20T15:01:02.780614 v1.01 "
-            'application/json {"path": "", "start_time": '
-            '"2021-12-17T09:59:00.300000", "end_time": '
-            '"2021-12-17T10:11:48.400000", "orbit_number": 1, "processing_time": '
-            '"2021-12-17T10:12:06.466000", "uri": '
-            f'"{fakefile!s}", "uid": '
-            '"RNSCA-RVIRS_npp_d20211217_t0959003_e1011484_b00001_'
-            'c20211217101206466000_all-_dev.h5", "sensor": ["viirs"], '
-            '"platform_name": "Suomi-NPP"}')
-
-
-@pytest.fixture
-def fake_result_names(tmp_path):
-    p = tmp_path / "results"
-    all = []
-    for lbl in ["GMTCO", "SVM02", "SVM09", "SVM10", "SVM12"]:
-        for f in [
-                f"{lbl:s}_j01_d20211229_t1342527_e1344173_b21313_c20211229140342734674_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1344185_e1345430_b21313_c20211229140341407055_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1345442_e1347070_b21313_c20211229140319026930_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1347082_e1348327_b21313_c20211229140346771475_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1348340_e1349585_b21313_c20211229140336541537_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1349597_e1351242_b21313_c20211229140303590485_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1351255_e1352482_b21313_c20211229140800466176_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1352495_e1354140_b21313_c20211229142321678073_cspp_dev.h5",
-                f"{lbl:s}_j01_d20211229_t1354152_e1355397_b21313_c20211229142320304291_cspp_dev.h5"]:
-            new = p / f
-            all.append(new)
-    return all
-
-
-@pytest.fixture
-def fake_results(tmp_path, fake_result_names):
-    p = tmp_path / "results"
-    p.mkdir(parents=True, exist_ok=True)
-    created = []
+            "/file/snpp/viirs/direktempfang", "file",
+            {**_FAKE_MESSAGE_DATA, "uri": os.fspath(fakefile)})
+
+
+_FAKE_RESULT_LABELS = ("GMTCO", "SVM02", "SVM09", "SVM10", "SVM12")
+
+_FAKE_RESULT_SUFFIXES = (
+    "_j01_d20211229_t1342527_e1344173_b21313_c20211229140342734674_cspp_dev.h5",
+    "_j01_d20211229_t1344185_e1345430_b21313_c20211229140341407055_cspp_dev.h5",
+    "_j01_d20211229_t1345442_e1347070_b21313_c20211229140319026930_cspp_dev.h5",
+    "_j01_d20211229_t1347082_e1348327_b21313_c20211229140346771475_cspp_dev.h5",
+    "_j01_d20211229_t1348340_e1349585_b21313_c20211229140336541537_cspp_dev.h5",
+    "_j01_d20211229_t1349597_e1351242_b21313_c20211229140303590485_cspp_dev.h5",
+    "_j01_d20211229_t1351255_e1352482_b21313_c20211229140800466176_cspp_dev.h5",
+    "_j01_d20211229_t1352495_e1354140_b21313_c20211229142321678073_cspp_dev.h5",
+    "_j01_d20211229_t1354152_e1355397_b21313_c20211229142320304291_cspp_dev.h5")
+
+
+@pytest.fixture(scope="session")
+def fake_result_names(tmp_path_factory):
+    """Return the paths (as strings) of fake SDR result files."""
+    base = os.fspath(tmp_path_factory.mktemp("results"))
+    return [os.path.join(base, lbl + suffix)
+            for lbl, suffix in itertools.product(_FAKE_RESULT_LABELS, _FAKE_RESULT_SUFFIXES)]
+
+
+@pytest.fixture(scope="session")
+def fake_results(fake_result_names):
+    """Create the fake SDR result files and return their paths."""
     for f in fake_result_names:
-        new = p / f
-        new.touch()
-        created.append(os.fspath(new))
-    return created
+        _touch(f)
+    return fake_result_names
 
 
 def test_run_fullswath(tmp_path, fakefile, fakemessage, caplog):
     """Test the runner with a single fullswath file."""
-    from cspp_runner.runner import ViirsSdrProcessor
-
-    with unittest.mock.patch("cspp_runner.runner.ThreadPool") as crT, \
-         unittest.mock.patch("cspp_runner.runner.fix_rdrfile") as csr:
+    with unittest.mock.patch.multiple(
+            "cspp_runner.runner",
+            ThreadPool=unittest.mock.DEFAULT,
+            fix_rdrfile=unittest.mock.DEFAULT) as mocks:
+        crT, csr = mocks["ThreadPool"], mocks["fix_rdrfile"]
         csr.return_value = (os.fspath(fakefile), 42)
-        vsp = ViirsSdrProcessor(1, tmp_path / "outdir")
+        vsp = cspp_runner_runner.ViirsSdrProcessor(1, tmp_path / "outdir")
         with caplog.at_level(logging.ERROR):
             vsp.run(fakemessage, "true", [])
         assert crT().apply_async.call_count == 1
         assert caplog.text == ""
 
 
-def test_publish(fake_results):
+def test_publish(fake_result_names):
     """Test publishing SDR."""
-    from cspp_runner.runner import publish_sdr
-
     class FakePublisher:
         def __init__(self):
             self.messages = []
@@ -109,9 +125,9 @@ def test_publish(fake_results):
 
     fake_publisher = FakePublisher()
 
-    publish_sdr(
+    cspp_runner_runner.publish_sdr(
             fake_publisher,
-            fake_results,
+            fake_result_names,
             {"orbit_number": 21200},
             "wonderland",
             "test",
@@ -126,13 +142,50 @@ def test_publish(fake_results):
     assert '"start_time": "2021-12-29T13:42:52.700000"' in msg
 
 
+class _FakeMirrorProcess:
+    """Stand-in for subprocess.Popen running a LUT/ancillary mirror script.
+
+    Acts like ``echo`` (writing its arguments to stdout), or like ``false``
+    when the script is called so, without starting a new process.
+    """
+
+    def __init__(self, cmd, **kwargs):
+        self.args = cmd
+        self.returncode = 1 if os.path.basename(cmd[0]) == "false" else 0
+        out = b"" if self.returncode else " ".join(cmd[1:]).encode("utf-8") + b"\n"
+        self.stdout = io.BytesIO(out)
+        self.stderr = io.BytesIO(b"")
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+class _FrozenDatetime(datetime.datetime):
+    """Datetime class whose utcnow is fixed at 2023-05-19 12:00."""
+
+    @classmethod
+    def utcnow(cls):
+        return cls(2023, 5, 19, 12, 0, 0)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cspp_workdir(tmp_path_factory):
+    """Point CSPP_WORKDIR to a directory shared by the tests in this module.
+
+    Tests needing another value (or none) override it with ``monkeypatch``.
+    """
+    workdir = tmp_path_factory.mktemp("env")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CSPP_WORKDIR", os.fspath(workdir))
+        yield workdir
+
+
 @pytest.mark.parametrize(
         "funcname", ["update_lut_files", "update_ancillary_files"])
 def test_update_missing_env(monkeypatch, tmp_path, funcname):
     """Test updating fails when env missing."""
     monkeypatch.delenv("CSPP_WORKDIR", raising=False)
-    import cspp_runner.runner
-    updater = getattr(cspp_runner.runner, funcname)
+    updater = getattr(cspp_runner_runner, funcname)
     # should raise exception when no workdir set
     with pytest.raises(EnvironmentError):
         updater(
@@ -144,144 +197,118 @@ def test_update_missing_env(monkeypatch, tmp_path, funcname):
 @pytest.mark.parametrize(
         "funcname,label", [("update_lut_files", "LUT"),
                            ("update_ancillary_files", "ANC")])
-def test_update_nominal(monkeypatch, tmp_path, caplog, funcname, label):
-    """Test update nominal case."""
-    import cspp_runner.runner
-    updater = getattr(cspp_runner.runner, funcname)
-    monkeypatch.setenv("CSPP_WORKDIR", os.fspath(tmp_path / "env"))
+@pytest.mark.parametrize(
+        "cmd,expect_success", [("echo", True), ("false", False)])
+def test_update(cspp_workdir, tmp_path, caplog, monkeypatch, funcname, label,
+                cmd, expect_success):
+    """Test updating, nominal and error cases.
+
+    A failed update is logged as an error and the stampfile is NOT updated in
+    this case."""
+    updater = getattr(cspp_runner_runner, funcname)
+    # Replace the runner's own subprocess and shutil names only, so neither
+    # the stdlib modules nor the executables on PATH are involved
+    monkeypatch.setattr(
+        cspp_runner_runner, "subprocess",
+        types.SimpleNamespace(
+            Popen=_FakeMirrorProcess,
+            PIPE=subprocess.PIPE,
+            TimeoutExpired=subprocess.TimeoutExpired))
+    monkeypatch.setattr(
+        cspp_runner_runner, "shutil", types.SimpleNamespace(which=lambda cmd: cmd))
+    monkeypatch.setattr(cspp_runner_runner, "datetime", _FrozenDatetime)
+    env = os.fspath(cspp_workdir)
+    stampfile = os.fspath(tmp_path / "stampfile")
     with caplog.at_level(logging.INFO):
         updater("gopher://dummy/location",
-                os.fspath(tmp_path / "stampfile"),
-                "echo")
+                stampfile,
+                cmd)
     assert f"Download command for {label:s}" in caplog.text
-    assert caplog.text.split("\n")[2].endswith(
-            f"-W {tmp_path / 'env'!s}")
-    assert "downloaded" in caplog.text
-    # I tried to use the technique at
-    # https://stackoverflow.com/a/20503374/974555 to patch datetime.now, but
-    # importing pandas fails if I do so, as pandas apparently also does some
-    # trickery.  Therefore instead hope that `now` was recent enough to fit in the
-    # previous minute at worst.
-    now = datetime.datetime.utcnow()
-    justnow = now - datetime.timedelta(seconds=5)
-    exp1 = tmp_path / f"stampfile.{now:%Y%m%d%H%M}"
-    exp2 = tmp_path / f"stampfile.{justnow:%Y%m%d%H%M}"
-    assert exp1.exists() or exp2.exists()
-
-
-@pytest.mark.parametrize(
-        "funcname", ["update_lut_files", "update_ancillary_files"])
-def test_update_error(monkeypatch, tmp_path, caplog, funcname):
-    """Check that a failed LUT update is logged to stderr.
-
-    And that the stampfile is NOT updated in this case."""
-    import cspp_runner.runner
-    updater = getattr(cspp_runner.runner, funcname)
-    monkeypatch.setenv("CSPP_WORKDIR", os.fspath(tmp_path / "env"))
-    with caplog.at_level(logging.ERROR):
-        updater(
-                "gother://dummy/location",
-                os.fspath(tmp_path / "stampfile"),
-                "false")
-    assert "exit code 1" in caplog.text
-    now = datetime.datetime.utcnow()
-    justnow = now - datetime.timedelta(seconds=5)
-    exp1 = tmp_path / f"stampfile.{now:%Y%m%d%H%M}"
-    exp2 = tmp_path / f"stampfile.{justnow:%Y%m%d%H%M}"
-    assert not exp1.exists()
-    assert not exp2.exists()
+    if expect_success:
+        assert caplog.records[2].getMessage().endswith(f"-W {env:s}")
+        assert "downloaded" in caplog.text
+    else:
+        assert "exit code 1" in caplog.text
+    assert os.path.exists(f"{stampfile:s}.202305191200") == expect_success
 
 
 def test_check_lut_files_virgin(tmp_path):
     """Test check LUT files, virgin case."""
-    import cspp_runner.runner
     empty_dir = tmp_path / "empty"
     empty_dir.mkdir()
-    res = cspp_runner.runner.check_lut_files(
+    res = cspp_runner_runner.check_lut_files(
             5, 1, "prefix", os.fspath(empty_dir))
     assert not res
 
 
 def test_check_lut_files_uptodate(tmp_path):
     """Test check LUT files, everything up to date."""
-    import cspp_runner.runner
     # create fake stamp files
-    now = datetime.datetime.now()
-    yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
-    yesteryear = datetime.datetime.now() - datetime.timedelta(days=400)
-    stamp = tmp_path / "stamp"
+    now = datetime.datetime.utcnow()
+    yesterday = now - datetime.timedelta(days=1)
+    yesteryear = now - datetime.timedelta(days=400)
+    stamp = os.fspath(tmp_path / "stamp")
     for dt in (yesteryear, yesterday, now):
-        fn = stamp.with_suffix(f".{dt:%Y%m%d%H%M}")
-        fn.touch()
-    res = cspp_runner.runner.check_lut_files(
-            5, 1, os.fspath(stamp), "irrelevant")
+        _touch(f"{stamp:s}.{dt:%Y%m%d%H%M}")
+    res = cspp_runner_runner.check_lut_files(
+            5, 1, stamp, "irrelevant", now=now)
     assert res
 
 
 def test_check_lut_files_outofdate(tmp_path, caplog):
     """Test check LUT files, out of date case."""
-    import cspp_runner.runner
     # create fake stamp file
-    yesteryear = datetime.datetime.now() - datetime.timedelta(days=400)
-    stamp = tmp_path / "stamp"
-    fn = stamp.with_suffix(f".{yesteryear:%Y%m%d%H%M}")
-    fn.touch()
-    # create fake LUT from yesteryear
+    yesteryear = datetime.datetime.utcnow() - datetime.timedelta(days=400)
+    stamp = os.fspath(tmp_path / "stamp")
+    _touch(f"{stamp:s}.{yesteryear:%Y%m%d%H%M}")
+    # create fake LUT, and check it 400 days from now
     lut_dir = tmp_path / "lut"
     lut_dir.mkdir()
     lutfile = lut_dir / "dummy"
     lutfile.touch()
-    os.utime(lutfile, (yesteryear.timestamp(),)*2)
-    res = cspp_runner.runner.check_lut_files(
+    res = cspp_runner_runner.check_lut_files(
             5, 1,
-            os.fspath(stamp),
-            os.fspath(lut_dir))
+            stamp,
+            os.fspath(lut_dir),
+            now=datetime.datetime.utcnow() + datetime.timedelta(days=400))
     assert not res
 
 
-def test_run_cspp(monkeypatch, tmp_path):
+def test_run_cspp():
     """Test running CSPP."""
-    import cspp_runner.runner
-    monkeypatch.setenv("CSPP_WORKDIR", os.fspath(tmp_path / "env"))
-    (tmp_path / "env").mkdir(parents=True)
-    cspp_runner.runner.run_cspp("true", [])
+    cspp_runner_runner.run_cspp("true", [])
 
 
-def test_spawn_cspp_nominal(tmp_path, caplog, fake_result_names, monkeypatch):
+def test_spawn_cspp_nominal(tmp_path, caplog, fake_result_names):
     """Test spawning CSPP successfully."""
-    import cspp_runner.runner
-    monkeypatch.setenv("CSPP_WORKDIR", os.fspath(tmp_path / "env"))
-    (tmp_path / "env").mkdir(parents=True)
 
     def fake_run_cspp(call, args, *rdrs):
         p = tmp_path / "working_dir"
         p.mkdir()
         for f in fake_result_names:
-            (p / f.name).touch()
+            (p / os.path.basename(f)).touch()
         return os.fspath(p)
     with unittest.mock.patch("cspp_runner.runner.run_cspp") as crr:
         crr.side_effect = fake_run_cspp
         with caplog.at_level(logging.DEBUG):
-            (wd, rf) = cspp_runner.runner.spawn_cspp(
+            (wd, rf) = cspp_runner_runner.spawn_cspp(
                 os.fspath(
                     tmp_path /
                     "RNSCA-RVIRS_j01_d20211229_t1342527_e1355397_b21199_c20211229144433345000_all-_dev.h5"),
                 viirs_sdr_call="touch",
                 viirs_sdr_options=[],
                 granule_time_tolerance=10)
-    assert "Start CSPP" in caplog.text
-    assert "CSPP probably failed" not in caplog.text
-    assert "Number of results files" in caplog.text
+    messages = [r.getMessage() for r in caplog.records]
+    for needle in ("Start CSPP", "Number of results files"):
+        assert any(needle in m for m in messages)
+    assert not any("CSPP probably failed" in m for m in messages)
     assert len(rf) == 5
 
 
-def test_spawn_cspp_failure(monkeypatch, tmp_path, caplog):
+def test_spawn_cspp_failure(tmp_path, caplog):
     """Test spawning CSPP unsuccessfully."""
-    import cspp_runner.runner
-    monkeypatch.setenv("CSPP_WORKDIR", os.fspath(tmp_path / "env"))
-    (tmp_path / "env").mkdir(parents=True)
     with caplog.at_level(logging.WARNING):
-        (wd, rf) = cspp_runner.runner.spawn_cspp(
+        (wd, rf) = cspp_runner_runner.spawn_cspp(
             *[os.fspath(tmp_path / f"file{i:d})")
                 for i in range(4)],
             viirs_sdr_call="false",
@@ -297,17 +324,33 @@ nameservers:
 """
 
 
+class _SyncPool:
+    """Synchronous stand-in for multiprocessing.pool.ThreadPool."""
+
+    def __init__(self, processes=None):
+        pass
+
+    def apply_async(self, func, args=(), kwds=None, callback=None):
+        result = func(*args, **(kwds or {}))
+        if callback is not None:
+            callback(result)
+        return types.SimpleNamespace(get=lambda: result)
+
+
+@pytest.fixture(scope="session")
+def publisher_yaml(tmp_path_factory):
+    """Write the fake publisher config once and return its path."""
+    p = tmp_path_factory.mktemp("yaml") / "publisher.yaml"
+    p.write_text(fake_publisher_config_contents, encoding="ascii")
+    return p
+
+
 def test_rolling_runner(tmp_path, caplog, monkeypatch, fakemessage,
-                        fake_results):
+                        fake_results, publisher_yaml):
     """Test NPP rolling runner."""
-    from cspp_runner.runner import npp_rolling_runner
-
     class TimeOut(Exception):
         pass
 
-    def handler(signum, frame):
-        raise TimeOut()
-
     fake_workdir = tmp_path / "workdir"
 
     def fake_spawn_cspp(current_granule, *glist, viirs_sdr_call,
@@ -315,32 +358,30 @@ def test_rolling_runner(tmp_path, caplog, monkeypatch, fakemessage,
         fake_workdir.mkdir(exist_ok=True, parents=True)
 
         return (os.fspath(fake_workdir), fake_results)
-    yaml_conf = tmp_path / "publisher.yaml"
-    with yaml_conf.open(mode="wt", encoding="ascii") as fp:
-        fp.write(fake_publisher_config_contents)
-
     monkeypatch.setenv("CSPP_WORKDIR", os.fspath(fake_workdir))
+    monkeypatch.setattr(cspp_runner_runner, "ThreadPool", _SyncPool)
     with unittest.mock.patch("posttroll.subscriber.Subscribe") as psS, \
          unittest.mock.patch("cspp_runner.runner.Publish"), \
          unittest.mock.patch("cspp_runner.runner.spawn_cspp", new=fake_spawn_cspp) as crs, \
          caplog.at_level(logging.DEBUG):
-        psS.return_value.__enter__.return_value.recv.return_value = [fakemessage]
+        # deliver the message once, then break out of the endless loop
+        recv = psS.return_value.__enter__.return_value.recv
+        recv.side_effect = [[fakemessage], TimeOut()]
         crs.return_value = (os.fspath(fake_workdir), fake_results)
         try:
-            signal.signal(signal.SIGALRM, handler)
-            signal.alarm(2)
-            npp_rolling_runner(7, 24,
-                               os.fspath(tmp_path / "stamp_lut"),
-                               os.fspath(tmp_path / "lut"),
-                               "gopher://example.org/luts", "true",
-                               "gopher://example.org/ancs",
-                               os.fspath(tmp_path / "stamp_anc"),
-                               "true", "/file/available/rdr", "earth",
-                               "test",
-                               "/product/available/sdr", tmp_path / "sdr/results",
-                               "true", [],
-                               ncpus=2,
-                               publisher_config=os.fspath(yaml_conf))
+            cspp_runner_runner.npp_rolling_runner(
+                7, 24,
+                os.fspath(tmp_path / "stamp_lut"),
+                os.fspath(tmp_path / "lut"),
+                "gopher://example.org/luts", "true",
+                "gopher://example.org/ancs",
+                os.fspath(tmp_path / "stamp_anc"),
+                "true", "/file/available/rdr", "earth",
+                "test",
+                "/product/available/sdr", tmp_path / "sdr/results",
+                "true", [],
+                ncpus=2,
+                publisher_config=os.fspath(publisher_yaml))
         except TimeOut:
             pass  # probably all is fine
         else:
@@ -351,19 +392,19 @@ def test_rolling_runner(tmp_path, caplog, monkeypatch, fakemessage,
              unittest.mock.patch("cspp_runner.runner.update_lut_files",
                                  autospec=True) as cru:
             crc.return_value = False
+            recv.side_effect = [[fakemessage], TimeOut()]
             try:
-                signal.signal(signal.SIGALRM, handler)
-                signal.alarm(2)
-                npp_rolling_runner(7, 24,
-                                   os.fspath(tmp_path / "stamp_lut"),
-                                   os.fspath(tmp_path / "lut"),
-                                   "gopher://example.org/luts", "true",
-                                   "gopher://example.org/ancs",
-                                   os.fspath(tmp_path / "stamp_anc"),
-                                   "true", "/file/available/rdr", "earth",
-                                   "test",
-                                   "/product/available/sdr", tmp_path / "sdr/results",
-                                   "true", [], 2)
+                cspp_runner_runner.npp_rolling_runner(
+                    7, 24,
+                    os.fspath(tmp_path / "stamp_lut"),
+                    os.fspath(tmp_path / "lut"),
+                    "gopher://example.org/luts", "true",
+                    "gopher://example.org/ancs",
+                    os.fspath(tmp_path / "stamp_anc"),
+                    "true", "/file/available/rdr", "earth",
+                    "test",
+                    "/product/available/sdr", tmp_path / "sdr/results",
+                    "true", [], 2)
             except TimeOut:
                 pass
             else:
@@ -372,8 +413,10 @@ def test_rolling_runner(tmp_path, caplog, monkeypatch, fakemessage,
                     "gopher://example.org/luts",
                     os.fspath(tmp_path / "stamp_lut"),
                     "true")
-    assert "Dynamic ancillary data will be updated" in caplog.text
-    assert "Received message data" in caplog.text
-    assert "Now that SDR processing has completed" in caplog.text
-    assert "Seconds to process SDR: " in caplog.text
-    assert "Seconds since granule start: " in caplog.text
+    messages = [r.getMessage() for r in caplog.records]
+    for needle in ("Dynamic ancillary data will be updated",
+                   "Received message data",
+                   "Now that SDR processing has completed",
+                   "Seconds to process SDR: ",
+                   "Seconds since granule start: "):
+        assert any(needle in m for m in messages), needle
@@ -22,20 +22,26 @@
 
 from cspp_runner import get_sdr_times, get_datetime_from_filename
 from datetime import datetime
-from unittest import TestCase
 
+import pytest
 
-class TestTimeExtraction(TestCase):
 
-    def test_get_sdr_times(self):
-        filename = 'GMODO_npp_d20120405_t0037099_e0038341_b00001_c20120405124731856767_cspp_dev.h5'
-        start_time, end_time = get_sdr_times(filename)
-        assert start_time == datetime(2012, 4, 5, 0, 37, 9, 900000)
-        assert end_time == datetime(2012, 4, 5, 0, 38, 34, 100000)
+@pytest.mark.parametrize(
+    "filename,expected_start,expected_end",
+    [('GMODO_npp_d20120405_t0037099_e0038341_b00001_c20120405124731856767_cspp_dev.h5',
+      datetime(2012, 4, 5, 0, 37, 9, 900000),
+      datetime(2012, 4, 5, 0, 38, 34, 100000)),
+     ('GMODO_npp_d20120405_t2359099_e0000341_b00001_c20120405124731856767_cspp_dev.h5',
+      datetime(2012, 4, 5, 23, 59, 9, 900000),
+      datetime(2012, 4, 6, 0, 0, 34, 100000))],
+    ids=["nominal", "over_midnight"])
+def test_get_sdr_times(filename, expected_start, expected_end):
+    start_time, end_time = get_sdr_times(filename)
+    assert start_time == expected_start
+    assert end_time == expected_end
+    assert get_datetime_from_filename(filename) == start_time
 
-    def test_get_sdr_times_over_midnight(self):
-        filename = 'GMODO_npp_d20120405_t2359099_e0000341_b00001_c20120405124731856767_cspp_dev.h5'
-        start_time, end_time = get_sdr_times(filename)
-        assert start_time == datetime(2012, 4, 5, 23, 59, 9, 900000)
-        assert end_time == datetime(2012, 4, 6, 0, 0, 34, 100000)
-        assert get_datetime_from_filename(filename) == start_time
+
+def test_get_sdr_times_invalid_filename():
+    with pytest.raises(ValueError):
+        get_sdr_times('GMODO_npp_nodate_b00001.h5')
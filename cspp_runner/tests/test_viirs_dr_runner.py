@@ -15,10 +15,15 @@
 
 """Tests for main cmdline script."""
 
+import configparser
+import logging
+import logging.handlers
 import os
 
 from unittest.mock import patch
 
+import pytest
+
 
 fake_conf_contents = """[test]
 subscribe_topics = mars, venus
@@ -50,15 +55,16 @@ def test_get_parser(ap):
     assert ap.return_value.add_argument.call_count == 4
 
 
-@patch("cspp_runner.viirs_dr_runner.parse_args")
-@patch("cspp_runner.viirs_dr_runner.npp_rolling_runner")
-def test_main(crn, cvp, tmp_path):
+@pytest.fixture
+def run_main(tmp_path):
+    """Run main() with a fake config.
+
+    Returns a function that takes extra config lines, runs main() with
+    npp_rolling_runner and setup_logging mocked and returns both mocks.
+    """
     import cspp_runner.viirs_dr_runner
 
-    # create fake config files
-    conf = tmp_path / "conf.ini"
-    with conf.open(mode="wt", encoding="ascii") as fp:
-        fp.write(fake_conf_contents)
+    # fake publisher config
     yaml_conf = tmp_path / "publisher.yaml"
     with yaml_conf.open(mode="wt", encoding="ascii") as fp:
         fp.write(fake_publisher_config_contents)
@@ -66,12 +72,127 @@ def test_main(crn, cvp, tmp_path):
     # fake log destination
     log = tmp_path / "log"
 
-    # fake
+    def _run(extra_conf_contents=""):
+        conf = tmp_path / "conf.ini"
+        with conf.open(mode="wt", encoding="ascii") as fp:
+            fp.write(fake_conf_contents + extra_conf_contents)
 
-    cvp.return_value = cspp_runner.viirs_dr_runner.get_parser().parse_args(
+        args = cspp_runner.viirs_dr_runner.get_parser().parse_args(
             ["-c", os.fspath(conf),
              "-C", "test",
              "-l", os.fspath(log),
              "-p", os.fspath(yaml_conf)])
-
-    cspp_runner.viirs_dr_runner.main()
+        with patch("cspp_runner.viirs_dr_runner.parse_args", return_value=args), \
+                patch("cspp_runner.viirs_dr_runner.setup_logging") as csl, \
+                patch("cspp_runner.viirs_dr_runner.npp_rolling_runner") as crn:
+            cspp_runner.viirs_dr_runner.main()
+        return crn, csl
+
+    return _run
+
+
+def test_main(run_main, tmp_path):
+    crn, csl = run_main()
+    csl.assert_called_once()
+    assert csl.call_args[0][1] == os.fspath(tmp_path / "log")
+    csl.return_value.stop.assert_called_once_with()
+    crn.assert_called_once()
+    (args, kwargs) = crn.call_args
+    assert args[0] == 14
+    assert args[1] == 1.0
+    assert args[9] == ["mars", "venus"]
+    assert args[11] == "unittest"
+    assert args[13] == "/nowhere/special"
+    assert args[14] == "true"
+    assert args[15] == ["abc"]
+    assert args[16:] == (10, 1)
+    assert kwargs == {"publisher_config": os.fspath(tmp_path / "publisher.yaml")}
+
+
+def test_main_ncpus_auto(run_main):
+    with patch("cspp_runner.viirs_dr_runner.get_available_cpus", return_value=42):
+        crn, _ = run_main("ncpus = auto\n")
+    (args, _) = crn.call_args
+    assert args[17] == 42
+
+
+@pytest.fixture
+def logging_setup(tmp_path):
+    """Call setup_logging with a log file and undo its changes afterwards.
+
+    Returns a function that takes config lines and returns the listener.
+    The tests have to stop the listener themselves.
+    """
+    from cspp_runner.viirs_dr_runner import setup_logging
+
+    root = logging.getLogger('')
+    root_handlers = root.handlers[:]
+    root_level = root.level
+    posttroll_level = logging.getLogger('posttroll').level
+    listeners = []
+
+    def _setup(conf_contents=""):
+        conf = configparser.ConfigParser(interpolation=None)
+        conf.read_string("[test]\n" + conf_contents)
+        listener = setup_logging(conf["test"], os.fspath(tmp_path / "log"))
+        listeners.append(listener)
+        return listener
+
+    yield _setup
+
+    for listener in listeners:
+        for handler in listener.handlers:
+            handler.flush()
+            getattr(handler, "target", handler).close()
+    for handler in root.handlers[:]:
+        if handler not in root_handlers:
+            root.removeHandler(handler)
+    root.setLevel(root_level)
+    logging.getLogger('posttroll').setLevel(posttroll_level)
+
+
+def test_setup_logging(logging_setup, tmp_path):
+    listener = logging_setup()
+    logging.getLogger("cspp_runner.test").info("Hello from the runner")
+    listener.stop()
+    assert "Hello from the runner" in (tmp_path / "log").read_text()
+
+
+def test_setup_logging_log_level(logging_setup):
+    listener = logging_setup("log_level = warning\n")
+    listener.stop()
+    root = logging.getLogger('')
+    (queue_handler,) = [handler for handler in root.handlers
+                        if isinstance(handler, logging.handlers.QueueHandler)]
+    assert root.level == logging.WARNING
+    assert queue_handler.level == logging.WARNING
+    assert listener.handlers[0].level == logging.WARNING
+    assert logging.getLogger('posttroll').level == logging.WARNING
+
+
+def test_setup_logging_log_buffer_capacity(logging_setup):
+    listener = logging_setup("log_buffer_capacity = 100\n")
+    listener.stop()
+    (handler,) = listener.handlers
+    assert isinstance(handler, logging.handlers.MemoryHandler)
+    assert handler.capacity == 100
+    assert handler.flushLevel == logging.ERROR
+    assert isinstance(handler.target, logging.handlers.TimedRotatingFileHandler)
+
+
+def test_setup_logging_log_rotation_bytes(logging_setup):
+    with patch.object(logging.handlers.RotatingFileHandler, "doRollover") as rollover:
+        listener = logging_setup("log_rotation_bytes = 1000\n")
+    listener.stop()
+    (handler,) = listener.handlers
+    assert type(handler) is logging.handlers.RotatingFileHandler
+    assert handler.maxBytes == 1000
+    assert handler.backupCount == 7
+    rollover.assert_not_called()
+
+
+def test_parse_viirs_sdr_options():
+    from cspp_runner.viirs_dr_runner import parse_viirs_sdr_options
+
+    assert parse_viirs_sdr_options('["-p 1", "-l"]') == ["-p 1", "-l"]
+    assert parse_viirs_sdr_options("['-p 1', '-l']") == ["-p 1", "-l"]
@@ -27,7 +27,9 @@ Trigger processing on direct readout RDR data (granules or full swaths).
 import argparse
 import ast
 import configparser
+import json
 import os
+import queue
 import sys
 import logging
 import logging.handlers
@@ -43,6 +45,9 @@ _DEFAULT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 #: Default log format
 _DEFAULT_LOG_FORMAT = '[%(levelname)s: %(asctime)s : %(name)s] %(message)s'
 
+#: Formatter for the log handler
+_FORMATTER = logging.Formatter(fmt=_DEFAULT_LOG_FORMAT,
+                               datefmt=_DEFAULT_TIME_FORMAT)
 
 LOG = logging.getLogger(__name__)
 
@@ -77,77 +82,142 @@ def parse_args():
     return parser.parse_args()
 
 
+def get_available_cpus():
+    """Get the number of CPUs this process is allowed to run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on all platforms, e.g. macOS
+        return os.cpu_count() or 1
+
+
+def parse_viirs_sdr_options(value):
+    """Parse the viirs_sdr_options config string.
+
+    JSON (e.g. ["-p 1", "-l"]) is parsed with the fast json parser, anything
+    else (e.g. ['-p 1', '-l']) as a Python literal.
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        return ast.literal_eval(value)
+
+
+def _split_list(value):
+    """Split a comma separated config string, stripping items and dropping empty ones."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def setup_logging(options, logfile=None):
+    """Set up logging to *logfile*, or to stderr if it is None.
+
+    The records are written by a background thread.  Return the started
+    QueueListener, which has to be stopped to write out the queued records.
+    """
+    if logfile is not None and "log_rotation_bytes" in options:
+        ncount = options.getint("log_rotation_backup", 7)
+        handler = logging.handlers.RotatingFileHandler(
+            logfile, maxBytes=options.getint("log_rotation_bytes"),
+            backupCount=ncount, encoding=None, delay=True)
+    elif logfile is not None:
+        ndays = options.getint("log_rotation_days", 1)
+        ncount = options.getint("log_rotation_backup", 7)
+        handler = logging.handlers.TimedRotatingFileHandler(
+            logfile, when='midnight', interval=ndays,
+            backupCount=ncount, encoding=None,
+            delay=False, utc=True)
+
+        handler.doRollover()
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+
+    log_level = options.get("log_level", "DEBUG").upper()
+    handler.setLevel(log_level)
+    handler.setFormatter(_FORMATTER)
+    log_buffer_capacity = options.getint("log_buffer_capacity", 0)
+    if log_buffer_capacity > 0:
+        # Write the records in batches, but errors immediately.  What is left
+        # in the buffer is flushed by logging.shutdown() at exit
+        handler = logging.handlers.MemoryHandler(
+            log_buffer_capacity, flushLevel=logging.ERROR, target=handler)
+        handler.setLevel(log_level)
+    # Let a background thread do the actual writing, so that logging does not
+    # block the processing
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True)
+    listener.start()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    root_logger = logging.getLogger('')
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(log_level)
+    logging.getLogger('posttroll').setLevel(max(logging.INFO, root_logger.level))
+
+    return listener
+
+
 def main():
     """Start the CSPP runner."""
-    CONF = configparser.ConfigParser()
+    CONF = configparser.ConfigParser(
+        interpolation=None,
+        converters={"list": _split_list, "sdroptions": parse_viirs_sdr_options})
 
     args = parse_args()
     print("Read config from", args.config_file)
 
     CONF.read(args.config_file)
 
-    OPTIONS = {}
-    for option, value in CONF.items(args.config_section, raw=True):
-        OPTIONS[option] = value
+    # Values are looked up in the section on demand, no copy is made
+    OPTIONS = CONF[args.config_section]
 
     publish_topic = OPTIONS.get('publish_topic')
-    subscribe_topics = OPTIONS.get('subscribe_topics').split(',')
-    subscribe_topics = [topic for topic in subscribe_topics if topic]
+    subscribe_topics = OPTIONS.getlist('subscribe_topics', [])
 
     site = OPTIONS.get('site')
 
-    thr_lut_files_age_days = OPTIONS.get('threshold_lut_files_age_days', 14)
+    thr_lut_files_age_days = OPTIONS.getint('threshold_lut_files_age_days', 14)
     url_jpss_remote_lut_dir = OPTIONS['url_jpss_remote_lut_dir']
     url_jpss_remote_anc_dir = OPTIONS['url_jpss_remote_anc_dir']
     lut_dir = OPTIONS.get('lut_dir', CSPP_RT_SDR_LUTS)
     lut_update_stampfile_prefix = OPTIONS['lut_update_stampfile_prefix']
     anc_update_stampfile_prefix = OPTIONS['anc_update_stampfile_prefix']
-    url_download_trial_frequency_hours = OPTIONS[
-        'url_download_trial_frequency_hours']
+    url_download_trial_frequency_hours = CONF.getfloat(
+        args.config_section, 'url_download_trial_frequency_hours')
     viirs_sdr_call = OPTIONS["viirs_sdr_call"]
-    viirs_sdr_options = ast.literal_eval(OPTIONS["viirs_sdr_options"])
-
-    if args.log is not None:
-        ndays = int(OPTIONS.get("log_rotation_days", 1))
-        ncount = int(OPTIONS.get("log_rotation_backup", 7))
-        handler = logging.handlers.TimedRotatingFileHandler(
-            args.log, when='midnight', interval=ndays,
-            backupCount=ncount, encoding=None,
-            delay=False, utc=True)
-
-        handler.doRollover()
-    else:
-        handler = logging.StreamHandler(sys.stderr)
-
-    handler.setLevel(logging.DEBUG)
-    formatter = logging.Formatter(fmt=_DEFAULT_LOG_FORMAT,
-                                  datefmt=_DEFAULT_TIME_FORMAT)
-    handler.setFormatter(formatter)
-    logging.getLogger('').addHandler(handler)
-    logging.getLogger('').setLevel(logging.DEBUG)
-    logging.getLogger('posttroll').setLevel(logging.INFO)
-
-    npp_rolling_runner(
-        thr_lut_files_age_days,
-        url_download_trial_frequency_hours,
-        lut_update_stampfile_prefix,
-        lut_dir,
-        url_jpss_remote_lut_dir,
-        OPTIONS.get("mirror_jpss_luts"),
-        url_jpss_remote_anc_dir,
-        anc_update_stampfile_prefix,
-        OPTIONS.get("mirror_jpss_ancillary"),
-        subscribe_topics,
-        site,
-        OPTIONS["mode"],
-        publish_topic,
-        OPTIONS["level1_home"],
-        viirs_sdr_call,
-        viirs_sdr_options,
-        int(OPTIONS.get("granule_time_tolerance", 10)),
-        int(OPTIONS.get("ncpus", 1)),
-        publisher_config=args.publisher,
-    )
+    viirs_sdr_options = CONF.getsdroptions(
+        args.config_section, "viirs_sdr_options")
+    granule_time_tolerance = OPTIONS.getint("granule_time_tolerance", 10)
+    ncpus = OPTIONS.get("ncpus", "1")
+    ncpus = get_available_cpus() if ncpus.strip() == "auto" else int(ncpus)
+
+    listener = setup_logging(OPTIONS, args.log)
+
+    try:
+        npp_rolling_runner(
+            thr_lut_files_age_days,
+            url_download_trial_frequency_hours,
+            lut_update_stampfile_prefix,
+            lut_dir,
+            url_jpss_remote_lut_dir,
+            OPTIONS.get("mirror_jpss_luts"),
+            url_jpss_remote_anc_dir,
+            anc_update_stampfile_prefix,
+            OPTIONS.get("mirror_jpss_ancillary"),
+            subscribe_topics,
+            site,
+            OPTIONS["mode"],
+            publish_topic,
+            OPTIONS["level1_home"],
+            viirs_sdr_call,
+            viirs_sdr_options,
+            granule_time_tolerance,
+            ncpus,
+            publisher_config=args.publisher,
+        )
+    finally:
+        # Write out the queued log records however the runner ends
+        listener.stop()
 
 
 if __name__ == "__main__":